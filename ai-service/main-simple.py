@@ -1,14 +1,29 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 import json
 import re
-from typing import List, Dict, Any
-import PyPDF2
+from typing import List, Dict, Any, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+import pypdfium2 as pdfium
+import ahocorasick
 import docx
+import hashlib
 import io
+import os
+import threading
 
-app = FastAPI(title="AI Interview Coach - Simple Service", version="1.0.0")
+try:
+    # RE2 matches in linear time, so uploaded resumes cannot trigger regex backtracking blowups
+    import re2 as _re
+except ImportError:
+    _re = re
+
+app = FastAPI(title="AI Interview Coach - Simple Service", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -21,6 +36,9 @@ app.add_middleware(
 
 # Pydantic models
 class ResumeAnalysis(BaseModel):
+    # Instances are cached and shared between requests, so they must not be mutated
+    model_config = ConfigDict(frozen=True)
+    
     skills: List[str]
     experience: List[str]
     education: List[str]
@@ -41,86 +59,234 @@ class AnswerAnalysisRequest(BaseModel):
     answer: str
     expected_keywords: List[str] = []
 
+# Uploads above this size are rejected before any PDF/DOCX parsing
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", 5 * 1024 * 1024))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Recent resume analyses keyed by content digest
+RESUME_CACHE_SIZE = 256
+_resume_cache: "OrderedDict[bytes, ResumeAnalysis]" = OrderedDict()
+_resume_cache_lock = threading.Lock()
+
+# PDFium is not thread-safe, and resumes are parsed on the threadpool
+_pdfium_lock = threading.Lock()
+
 # Simple text extraction functions
 def extract_text_from_pdf(file_content: bytes) -> str:
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(file_content)
+            try:
+                pages = [pdf[i].get_textpage().get_text_range() for i in range(len(pdf))]
+            finally:
+                pdf.close()
+        # PDFium separates lines with \r\n; normalise so the line-based section rules see \n
+        return "".join(page + "\n" for page in pages).replace("\r\n", "\n")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading PDF: {str(e)}")
 
 def extract_text_from_docx(file_content: bytes) -> str:
     try:
         doc = docx.Document(io.BytesIO(file_content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading DOCX: {str(e)}")
 
-# Simple parsing functions using regex patterns
-def extract_skills(text: str) -> List[str]:
-    # Common technical skills patterns
-    skill_patterns = [
-        r'\b(?:Python|Java|JavaScript|React|Node\.js|Angular|Vue|HTML|CSS|SQL|MongoDB|PostgreSQL|MySQL|Git|Docker|Kubernetes|AWS|Azure|GCP|Linux|Windows|MacOS|C\+\+|C#|PHP|Ruby|Go|Rust|Swift|Kotlin|TypeScript|Bootstrap|jQuery|Express|Django|Flask|Spring|Laravel|Rails|TensorFlow|PyTorch|Pandas|NumPy|Scikit-learn|Matplotlib|Seaborn|Tableau|Power BI|Excel|Photoshop|Illustrator|Figma|Sketch|InDesign|Premiere|After Effects|Unity|Unreal|Blender|Maya|AutoCAD|SolidWorks|MATLAB|R|Stata|SPSS|Salesforce|HubSpot|Slack|Jira|Trello|Asana|Notion|Confluence|SharePoint|Office 365|Google Workspace)\b',
-        r'\b(?:Machine Learning|Data Science|Artificial Intelligence|Deep Learning|Natural Language Processing|Computer Vision|DevOps|Cloud Computing|Cybersecurity|Web Development|Mobile Development|Full Stack|Frontend|Backend|Database|API|REST|GraphQL|Microservices|Agile|Scrum|Kanban|Project Management|Digital Marketing|SEO|SEM|Social Media|Content Marketing|Email Marketing|Analytics|UX|UI|Design|Branding|Photography|Video Editing|3D Modeling|Animation|Game Development|Blockchain|Cryptocurrency|IoT|Robotics|Automation|Testing|QA|CI/CD|Version Control|Networking|System Administration|Technical Writing|Data Analysis|Business Analysis|Product Management|Strategy|Consulting|Sales|Customer Service|HR|Finance|Accounting|Legal|Healthcare|Education|Research)\b'
-    ]
-    
-    skills = set()
-    for pattern in skill_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        skills.update([match.strip() for match in matches])
-    
-    return list(skills)[:20]  # Limit to top 20 skills
+# Supported document formats keyed by first byte: (full magic prefix, text extractor).
+# DOCX files are ZIP archives; legacy OLE .doc files have no extractor and are rejected.
+DOCUMENT_FORMATS = {
+    b"%": (b"%PDF-", extract_text_from_pdf),
+    b"P": (b"PK\x03\x04", extract_text_from_docx),
+}
 
-def extract_experience(text: str) -> List[str]:
-    # Look for experience/work history patterns
-    experience_patterns = [
-        r'(?:Experience|Work History|Employment|Career|Professional Experience)[\s\S]*?(?=Education|Skills|Projects|$)',
-        r'\d{4}\s*[-–]\s*(?:\d{4}|Present|Current).*?(?=\n\n|\d{4}\s*[-–]|$)',
-        r'(?:Software Engineer|Developer|Manager|Analyst|Consultant|Designer|Architect|Lead|Senior|Junior|Intern).*?(?=\n\n|$)'
-    ]
-    
-    experiences = []
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-        experiences.extend([match.strip()[:200] for match in matches if len(match.strip()) > 20])
-    
-    return experiences[:10]  # Limit to top 10 experiences
+# Extraction tables built once at import time
+# Common technical skills
+SKILL_KEYWORDS = (
+    "Python", "Java", "JavaScript", "React", "Node.js", "Angular", "Vue", "HTML", "CSS", "SQL",
+    "MongoDB", "PostgreSQL", "MySQL", "Git", "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Linux",
+    "Windows", "MacOS", "C++", "C#", "PHP", "Ruby", "Go", "Rust", "Swift", "Kotlin", "TypeScript",
+    "Bootstrap", "jQuery", "Express", "Django", "Flask", "Spring", "Laravel", "Rails", "TensorFlow",
+    "PyTorch", "Pandas", "NumPy", "Scikit-learn", "Matplotlib", "Seaborn", "Tableau", "Power BI",
+    "Excel", "Photoshop", "Illustrator", "Figma", "Sketch", "InDesign", "Premiere", "After Effects",
+    "Unity", "Unreal", "Blender", "Maya", "AutoCAD", "SolidWorks", "MATLAB", "R", "Stata", "SPSS",
+    "Salesforce", "HubSpot", "Slack", "Jira", "Trello", "Asana", "Notion", "Confluence",
+    "SharePoint", "Office 365", "Google Workspace",
+)
 
-def extract_education(text: str) -> List[str]:
+# Broader domain and methodology skills
+CONCEPT_KEYWORDS = (
+    "Machine Learning", "Data Science", "Artificial Intelligence", "Deep Learning",
+    "Natural Language Processing", "Computer Vision", "DevOps", "Cloud Computing", "Cybersecurity",
+    "Web Development", "Mobile Development", "Full Stack", "Frontend", "Backend", "Database", "API",
+    "REST", "GraphQL", "Microservices", "Agile", "Scrum", "Kanban", "Project Management",
+    "Digital Marketing", "SEO", "SEM", "Social Media", "Content Marketing", "Email Marketing",
+    "Analytics", "UX", "UI", "Design", "Branding", "Photography", "Video Editing", "3D Modeling",
+    "Animation", "Game Development", "Blockchain", "Cryptocurrency", "IoT", "Robotics",
+    "Automation", "Testing", "QA", "CI/CD", "Version Control", "Networking",
+    "System Administration", "Technical Writing", "Data Analysis", "Business Analysis",
+    "Product Management", "Strategy", "Consulting", "Sales", "Customer Service", "HR", "Finance",
+    "Accounting", "Legal", "Healthcare", "Education", "Research",
+)
+
+# Answer analysis keywords, matched as substrings so stems like "learn" also catch "learning"
+POSITIVE_KEYWORDS = ("experience", "project", "team", "challenge", "solution", "result", "learn", "improve", "achieve", "successful")
+STRUCTURE_PHRASES = ("first", "then", "finally", "because", "therefore", "as a result")
+EXAMPLE_PHRASES = ("example", "instance", "time when", "experience")
+
+@dataclass(frozen=True)
+class _Patterns:
+    """Every regex the service uses, compiled once at import time"""
+    # Section parsing runs on uploaded text, so these stay lookaround-free for RE2
+    date_range: Any
+    date_stop: Any
+    project_label: Any
+    experience_stop: Any
+    education_stop: Any
+    project_stop: Any
+    # Answer keywords; the lookahead lets findall() report overlapping hits
+    positive_keywords: Any
+    structure_phrases: Any
+    example_phrases: Any
+
+PATTERNS = _Patterns(
+    date_range=_re.compile(r'(?i)\d{4}\s*[-–]\s*(?:\d{4}|Present|Current)'),
+    date_stop=_re.compile(r'\d{4}\s*[-–]'),
+    project_label=_re.compile(r'(?i)Project\s*:'),
+    experience_stop=_re.compile(r'(?i)Education|Skills|Projects'),
+    education_stop=_re.compile(r'(?i)Experience|Skills|Projects'),
+    project_stop=_re.compile(r'(?i)Education|Skills|Experience'),
+    positive_keywords=re.compile('(?=(' + '|'.join(map(re.escape, POSITIVE_KEYWORDS)) + '))'),
+    structure_phrases=re.compile('|'.join(map(re.escape, STRUCTURE_PHRASES))),
+    example_phrases=re.compile('|'.join(map(re.escape, EXAMPLE_PHRASES))),
+)
+
+# Section rules are (section, start, stop) triples: an entry runs from a start hit up to
+# the first stop match or the end of that line. Literal starts are tuples of headings found
+# by RESUME_AUTOMATON; the two non-literal openers are patterns from PATTERNS.
+SECTION_RULES = (
+    # Look for experience/work history patterns
+    ('experience', ('Experience', 'Work History', 'Employment', 'Career', 'Professional Experience'),
+     PATTERNS.experience_stop),
+    ('experience', PATTERNS.date_range, PATTERNS.date_stop),
+    ('experience', ('Software Engineer', 'Developer', 'Manager', 'Analyst', 'Consultant', 'Designer',
+                    'Architect', 'Lead', 'Senior', 'Junior', 'Intern'), None),
     # Look for education patterns
-    education_patterns = [
-        r'(?:Education|Academic|Qualification|Degree|University|College|School)[\s\S]*?(?=Experience|Skills|Projects|$)',
-        r'(?:Bachelor|Master|PhD|Doctorate|Diploma|Certificate).*?(?=\n\n|$)',
-        r'(?:B\.S\.|B\.A\.|M\.S\.|M\.A\.|MBA|Ph\.D\.).*?(?=\n\n|$)'
-    ]
+    ('education', ('Education', 'Academic', 'Qualification', 'Degree', 'University', 'College', 'School'),
+     PATTERNS.education_stop),
+    ('education', ('Bachelor', 'Master', 'PhD', 'Doctorate', 'Diploma', 'Certificate'), None),
+    ('education', ('B.S.', 'B.A.', 'M.S.', 'M.A.', 'MBA', 'Ph.D.'), None),
+    # Look for project patterns
+    ('projects', ('Projects', 'Portfolio', 'Work Samples'), PATTERNS.project_stop),
+    ('projects', PATTERNS.project_label, PATTERNS.project_label),
+    ('projects', ('Built', 'Developed', 'Created', 'Designed', 'Implemented'), None),
+)
+
+# (minimum entry length, maximum entries) per section
+SECTION_LIMITS = {
+    'experience': (20, 10),
+    'education': (10, 5),
+    'projects': (20, 8),
+}
+
+# One Aho-Corasick automaton over every skill keyword and literal section heading, matched
+# against lowercased text. Each value is (length, skill or None, ((rule index, order), ...)).
+_automaton_entries = {}
+for _keyword in SKILL_KEYWORDS + CONCEPT_KEYWORDS:
+    _automaton_entries[_keyword.lower()] = [_keyword, []]
+for _rule_index, (_section, _start, _stop) in enumerate(SECTION_RULES):
+    if isinstance(_start, tuple):
+        for _order, _heading in enumerate(_start):
+            _automaton_entries.setdefault(_heading.lower(), [None, []])[1].append((_rule_index, _order))
+
+RESUME_AUTOMATON = ahocorasick.Automaton()
+for _key, (_skill, _headings) in _automaton_entries.items():
+    RESUME_AUTOMATON.add_word(_key, (len(_key), _skill, tuple(_headings)))
+RESUME_AUTOMATON.make_automaton()
+
+# Simple parsing functions
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    return not (start > 0 and _is_word_char(text[start - 1])) and not (end < len(text) and _is_word_char(text[end]))
+
+def _lower(text: str) -> str:
+    text_lower = text.lower()
+    if len(text_lower) != len(text):
+        # A few characters lowercase to two code points; keep offsets aligned with the original
+        text_lower = ''.join(ch.lower()[0] for ch in text)
+    return text_lower
+
+def _line_entry_end(text: str, match_end: int, stop_pattern) -> int:
+    end = text.find('\n', match_end)
+    if end == -1:
+        end = len(text)
+    if stop_pattern:
+        stop = stop_pattern.search(text, match_end, end)
+        if stop:
+            end = stop.start()
+    return end
+
+def _find_entries(start_pattern, stop_pattern, text: str) -> List[str]:
+    """Collect every entry opened by a non-literal start pattern"""
+    entries = []
+    pos = 0
+    while True:
+        match = start_pattern.search(text, pos)
+        if not match:
+            return entries
+        
+        end = _line_entry_end(text, match.end(), stop_pattern)
+        entries.append(text[match.start():end])
+        pos = end
+
+def _entries_from_hits(hits, stop_pattern, text: str) -> List[str]:
+    """Collect entries from automaton hits, leftmost first like a regex findall"""
+    entries = []
+    pos = 0
+    for start, _, match_end in sorted(hits):
+        if start < pos:
+            continue
+        
+        end = _line_entry_end(text, match_end, stop_pattern)
+        entries.append(text[start:end])
+        pos = end
+    return entries
+
+@lru_cache(maxsize=128)
+def analyze_resume_text(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Extract skills, experience, education and projects in a single scan of the text"""
+    text_lower = _lower(text)
+    skills = set()
+    heading_hits = [[] for _ in SECTION_RULES]
     
-    education = []
-    for pattern in education_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-        education.extend([match.strip()[:200] for match in matches if len(match.strip()) > 10])
+    for end, (length, skill, headings) in RESUME_AUTOMATON.iter(text_lower):
+        start = end - length + 1
+        for rule_index, order in headings:
+            heading_hits[rule_index].append((start, order, end + 1))
+        
+        # Skills only count as whole words, as the old \b-delimited regexes did
+        if skill and _is_whole_word(text_lower, start, end + 1):
+            skills.add(skill)
     
-    return education[:5]  # Limit to top 5 education entries
-
-def extract_projects(text: str) -> List[str]:
-    # Look for project patterns
-    project_patterns = [
-        r'(?:Projects|Portfolio|Work Samples)[\s\S]*?(?=Education|Skills|Experience|$)',
-        r'Project\s*:.*?(?=\n\n|Project\s*:|$)',
-        r'(?:Built|Developed|Created|Designed|Implemented).*?(?=\n\n|$)'
-    ]
+    sections = {section: [] for section in SECTION_LIMITS}
+    for rule_index, (section, start, stop) in enumerate(SECTION_RULES):
+        if isinstance(start, tuple):
+            matches = _entries_from_hits(heading_hits[rule_index], stop, text)
+        else:
+            matches = _find_entries(start, stop, text)
+        min_length = SECTION_LIMITS[section][0]
+        sections[section].extend([match.strip()[:200] for match in matches if len(match.strip()) > min_length])
     
-    projects = []
-    for pattern in project_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-        projects.extend([match.strip()[:200] for match in matches if len(match.strip()) > 20])
+    for section, (_, max_entries) in SECTION_LIMITS.items():
+        sections[section] = tuple(sections[section][:max_entries])
     
-    return projects[:8]  # Limit to top 8 projects
+    # Limit to top 20 skills
+    return tuple(list(skills)[:20]), sections['experience'], sections['education'], sections['projects']
+
+# Common skills suggested when a resume does not mention them
+COMMON_SKILLS = ("Python", "JavaScript", "SQL", "Git", "Docker", "AWS", "React", "Node.js")
+COMMON_SKILLS_LC = tuple((skill, skill.lower()) for skill in COMMON_SKILLS)
 
 # Predefined interview questions by role and difficulty
 INTERVIEW_QUESTIONS = {
@@ -195,69 +361,149 @@ INTERVIEW_QUESTIONS = {
     }
 }
 
+# Generic questions for unknown roles
+GENERIC_QUESTIONS = {
+    "easy": [
+        "Tell me about yourself and your professional background.",
+        "What interests you about this role?",
+        "What are your greatest strengths?",
+        "Describe a typical day in your current/previous role.",
+        "What motivates you in your work?"
+    ],
+    "medium": [
+        "Describe a challenging project you worked on and how you handled it.",
+        "How do you prioritize tasks when you have multiple deadlines?",
+        "Tell me about a time you had to learn something new quickly.",
+        "How do you handle feedback and criticism?",
+        "Describe a situation where you had to work with a difficult team member."
+    ],
+    "hard": [
+        "Where do you see yourself in 5 years?",
+        "Describe a time when you failed and what you learned from it.",
+        "How would you handle a situation where you disagree with your manager?",
+        "What would you do if you were asked to do something unethical?",
+        "How do you stay current with industry trends and developments?"
+    ]
+}
+
+# Flattened (role, difficulty) -> questions lookup; generic questions live under role None
+QUESTION_INDEX = {
+    (role, difficulty): tuple(questions)
+    for role, by_difficulty in INTERVIEW_QUESTIONS.items()
+    for difficulty, questions in by_difficulty.items()
+}
+QUESTION_INDEX.update({(None, difficulty): tuple(questions) for difficulty, questions in GENERIC_QUESTIONS.items()})
+
+# Canned inputs run once at startup so the first real request doesn't pay for warming
+# the section/skill matching and answer patterns
+WARMUP_RESUME_TEXT = (
+    "Experience\nSoftware Engineer 2020 - 2023 using Python, Docker and SQL\n"
+    "Education\nBachelor of Science in Computer Science, University\n"
+    "Projects\nProject: Interview coach built with React and Node.js\n"
+)
+WARMUP_ANSWER_TEXT = "first, for example, i led the team and improved delivery results"
+
+@app.on_event("startup")
+async def warm_up():
+    analyze_resume_text(WARMUP_RESUME_TEXT)
+    analyze_resume_text.cache_clear()
+    PATTERNS.positive_keywords.findall(WARMUP_ANSWER_TEXT)
+    PATTERNS.structure_phrases.search(WARMUP_ANSWER_TEXT)
+    PATTERNS.example_phrases.search(WARMUP_ANSWER_TEXT)
+
 @app.get("/")
 async def root():
     return {"message": "AI Interview Coach Service - Simple Version", "status": "running"}
 
+def _analyze_bytes(content: bytes) -> ResumeAnalysis:
+    """Run the blocking text extraction and parsing for an uploaded resume"""
+    # Extract text based on the file's leading magic bytes rather than its name
+    magic, extract_text = DOCUMENT_FORMATS.get(content[:1], (None, None))
+    if extract_text is None or not content.startswith(magic):
+        raise HTTPException(status_code=400, detail="Unsupported file format. Please upload PDF or DOCX files.")
+    text = extract_text(content)
+    
+    # Extract information using simple parsing
+    skills, experience, education, projects = analyze_resume_text(text)
+    
+    num_skills, num_experience, num_education, num_projects = map(len, (skills, experience, education, projects))
+    
+    # Simple scoring based on content richness
+    match_score = min(95, max(60, num_skills * 3 + num_experience * 5 + num_education * 2 + num_projects * 4))
+    
+    # Generate simple feedback
+    strengths = []
+    suggestions = []
+    
+    if num_skills > 10:
+        strengths.append("Strong technical skill set with diverse technologies")
+    if num_experience > 3:
+        strengths.append("Solid professional experience background")
+    if num_projects > 2:
+        strengths.append("Good project portfolio demonstrating practical application")
+    
+    if num_skills < 8:
+        suggestions.append("Consider adding more technical skills to strengthen your profile")
+    if num_experience < 2:
+        suggestions.append("Include more detailed work experience descriptions")
+    if num_projects < 2:
+        suggestions.append("Add more projects to showcase your practical skills")
+    
+    # Common missing skills suggestions
+    skills_lc = {s.lower() for s in skills}
+    missing_skills = [skill for skill, skill_lc in COMMON_SKILLS_LC if skill_lc not in skills_lc]
+    
+    return ResumeAnalysis(
+        skills=skills,
+        experience=experience,
+        education=education,
+        projects=projects,
+        match_score=match_score,
+        strengths=strengths[:5],
+        suggestions=suggestions[:5],
+        missing_skills=missing_skills[:8]
+    )
+
+def _analyze_upload(content: bytes) -> ResumeAnalysis:
+    """_analyze_bytes memoised on the upload's SHA-256 digest, so re-uploads skip all parsing"""
+    key = hashlib.sha256(content).digest()
+    with _resume_cache_lock:
+        cached = _resume_cache.get(key)
+        if cached is not None:
+            _resume_cache.move_to_end(key)
+            return cached
+    
+    result = _analyze_bytes(content)
+    with _resume_cache_lock:
+        _resume_cache[key] = result
+        if len(_resume_cache) > RESUME_CACHE_SIZE:
+            _resume_cache.popitem(last=False)
+    return result
+
+async def _read_upload(file: UploadFile, limit: int) -> bytes:
+    """Read an upload in chunks, rejecting it as soon as it grows past limit bytes"""
+    chunks = []
+    size = 0
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return b"".join(chunks)
+        size += len(chunk)
+        if size > limit:
+            raise HTTPException(status_code=413, detail=f"File too large. Maximum upload size is {limit // (1024 * 1024)} MB.")
+        chunks.append(chunk)
+
 @app.post("/analyze-resume", response_model=ResumeAnalysis)
 async def analyze_resume(file: UploadFile = File(...)):
+    # Read file content, refusing oversized uploads before any parsing
+    content = await _read_upload(file, MAX_UPLOAD_BYTES)
+    
     try:
-        # Read file content
-        content = await file.read()
-        
-        # Extract text based on file type
-        if file.filename.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(content)
-        elif file.filename.lower().endswith(('.docx', '.doc')):
-            text = extract_text_from_docx(content)
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file format. Please upload PDF or DOCX files.")
-        
-        # Extract information using simple parsing
-        skills = extract_skills(text)
-        experience = extract_experience(text)
-        education = extract_education(text)
-        projects = extract_projects(text)
-        
-        # Simple scoring based on content richness
-        match_score = min(95, max(60, len(skills) * 3 + len(experience) * 5 + len(education) * 2 + len(projects) * 4))
-        
-        # Generate simple feedback
-        strengths = []
-        suggestions = []
-        missing_skills = []
-        
-        if len(skills) > 10:
-            strengths.append("Strong technical skill set with diverse technologies")
-        if len(experience) > 3:
-            strengths.append("Solid professional experience background")
-        if len(projects) > 2:
-            strengths.append("Good project portfolio demonstrating practical application")
-        
-        if len(skills) < 8:
-            suggestions.append("Consider adding more technical skills to strengthen your profile")
-        if len(experience) < 2:
-            suggestions.append("Include more detailed work experience descriptions")
-        if len(projects) < 2:
-            suggestions.append("Add more projects to showcase your practical skills")
-        
-        # Common missing skills suggestions
-        common_skills = ["Python", "JavaScript", "SQL", "Git", "Docker", "AWS", "React", "Node.js"]
-        for skill in common_skills:
-            if skill.lower() not in [s.lower() for s in skills]:
-                missing_skills.append(skill)
-        
-        return ResumeAnalysis(
-            skills=skills,
-            experience=experience,
-            education=education,
-            projects=projects,
-            match_score=match_score,
-            strengths=strengths[:5],
-            suggestions=suggestions[:5],
-            missing_skills=missing_skills[:8]
-        )
+        # Document parsing and extraction are CPU-bound, so keep them off the event loop
+        return await run_in_threadpool(_analyze_upload, content)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing resume: {str(e)}")
 
@@ -267,36 +513,11 @@ async def generate_questions(request: QuestionRequest):
         role = request.job_role.lower()
         difficulty = request.difficulty.lower()
         
-        # Find matching role or use generic questions
-        questions = []
-        if role in INTERVIEW_QUESTIONS:
-            questions = INTERVIEW_QUESTIONS[role].get(difficulty, INTERVIEW_QUESTIONS[role]["medium"])
-        else:
-            # Generic questions for unknown roles
-            generic_questions = {
-                "easy": [
-                    "Tell me about yourself and your professional background.",
-                    "What interests you about this role?",
-                    "What are your greatest strengths?",
-                    "Describe a typical day in your current/previous role.",
-                    "What motivates you in your work?"
-                ],
-                "medium": [
-                    "Describe a challenging project you worked on and how you handled it.",
-                    "How do you prioritize tasks when you have multiple deadlines?",
-                    "Tell me about a time you had to learn something new quickly.",
-                    "How do you handle feedback and criticism?",
-                    "Describe a situation where you had to work with a difficult team member."
-                ],
-                "hard": [
-                    "Where do you see yourself in 5 years?",
-                    "Describe a time when you failed and what you learned from it.",
-                    "How would you handle a situation where you disagree with your manager?",
-                    "What would you do if you were asked to do something unethical?",
-                    "How do you stay current with industry trends and developments?"
-                ]
-            }
-            questions = generic_questions.get(difficulty, generic_questions["medium"])
+        # Find matching role or fall back to generic questions
+        questions = (QUESTION_INDEX.get((role, difficulty))
+                     or QUESTION_INDEX.get((role, "medium"))
+                     or QUESTION_INDEX.get((None, difficulty))
+                     or QUESTION_INDEX[(None, "medium")])
         
         return {
             "questions": questions,
@@ -312,7 +533,6 @@ async def generate_questions(request: QuestionRequest):
 async def analyze_answer(request: AnswerAnalysisRequest):
     try:
         answer = request.answer.lower()
-        question = request.question.lower()
         
         # Simple scoring based on answer length and keyword presence
         word_count = len(answer.split())
@@ -333,8 +553,7 @@ async def analyze_answer(request: AnswerAnalysisRequest):
             feedback.append("Excellent detailed response")
         
         # Keyword analysis
-        positive_keywords = ["experience", "project", "team", "challenge", "solution", "result", "learn", "improve", "achieve", "successful"]
-        keyword_count = sum(1 for keyword in positive_keywords if keyword in answer)
+        keyword_count = len(set(PATTERNS.positive_keywords.findall(answer)))
         
         if keyword_count > 3:
             score += 15
@@ -343,7 +562,7 @@ async def analyze_answer(request: AnswerAnalysisRequest):
             score += 10
         
         # Structure analysis
-        if any(phrase in answer for phrase in ["first", "then", "finally", "because", "therefore", "as a result"]):
+        if PATTERNS.structure_phrases.search(answer):
             score += 10
             feedback.append("Well-structured response with clear flow")
         
@@ -356,7 +575,7 @@ async def analyze_answer(request: AnswerAnalysisRequest):
             suggestions.append("Provide more specific examples and details")
         if keyword_count < 2:
             suggestions.append("Include more relevant professional terminology")
-        if not any(phrase in answer for phrase in ["example", "instance", "time when", "experience"]):
+        if not PATTERNS.example_phrases.search(answer):
             suggestions.append("Use specific examples to illustrate your points")
         
         return {
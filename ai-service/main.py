@@ -1,5 +1,7 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 import uvicorn
@@ -10,13 +12,15 @@ from services.resume_parser import ResumeParser
 from services.question_generator import QuestionGenerator
 from services.answer_analyzer import AnswerAnalyzer
 from services.feedback_generator import FeedbackGenerator
+from services.job_queue import JobQueue
 
 load_dotenv()
 
 app = FastAPI(
     title="AI Interview Coach - AI Service",
     description="AI microservice for resume parsing, question generation, and answer analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -33,6 +37,7 @@ resume_parser = ResumeParser()
 question_generator = QuestionGenerator()
 answer_analyzer = AnswerAnalyzer()
 feedback_generator = FeedbackGenerator()
+job_queue = JobQueue(max_workers=int(os.getenv("ANALYSIS_WORKERS", 2)))
 
 # Pydantic models
 class ResumeParseRequest(BaseModel):
@@ -50,6 +55,9 @@ class AnswerAnalysisRequest(BaseModel):
     category: str
     jobRole: str
 
+class AnswerBatchAnalysisRequest(BaseModel):
+    answers: List[AnswerAnalysisRequest]
+
 class ResumeAnalysisRequest(BaseModel):
     parsedData: Dict
     targetRole: Optional[str] = None
@@ -98,7 +106,9 @@ async def generate_questions(request: QuestionGenerationRequest):
 async def analyze_answer(request: AnswerAnalysisRequest):
     """Analyze user's answer and provide feedback"""
     try:
-        analysis = answer_analyzer.analyze(
+        # spaCy parsing and scoring are CPU-bound, so keep them off the event loop
+        analysis = await run_in_threadpool(
+            answer_analyzer.analyze,
             question=request.question,
             answer=request.answer,
             category=request.category,
@@ -111,37 +121,74 @@ async def analyze_answer(request: AnswerAnalysisRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Answer analysis failed: {str(e)}")
 
-@app.post("/analyze-audio")
-async def analyze_audio(audio_data: bytes):
+@app.post("/analyze-answers")
+async def analyze_answers(request: AnswerBatchAnalysisRequest):
+    """Analyze several answers in one call and provide feedback for each"""
+    try:
+        analyses = await run_in_threadpool(answer_analyzer.analyze_batch, [
+            (item.question, item.answer, item.category, item.jobRole)
+            for item in request.answers
+        ])
+        
+        feedback = [feedback_generator.generate_feedback(analysis) for analysis in analyses]
+        
+        return {"success": True, "feedback": feedback}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Answer analysis failed: {str(e)}")
+
+def run_audio_analysis(audio_data: bytes) -> Dict:
     """Analyze audio for speech patterns, tone, and clarity"""
+    # TODO: Implement audio analysis
+    return {
+        "clarity": 85,
+        "pace": 75,
+        "tone": "confident",
+        "fillerWords": 3,
+        "confidence": 80
+    }
+
+def run_video_analysis(video_data: bytes) -> Dict:
+    """Analyze video for facial expressions and body language"""
+    # TODO: Implement video analysis with OpenCV and DeepFace
+    return {
+        "eyeContact": 80,
+        "facialExpressions": ["confident", "engaged"],
+        "posture": "good",
+        "gestures": "appropriate"
+    }
+
+@app.post("/analyze-audio")
+async def analyze_audio(file: UploadFile = File(...)):
+    """Queue audio analysis and return a job id to poll at /jobs/{job_id}"""
     try:
-        # TODO: Implement audio analysis
-        analysis = {
-            "clarity": 85,
-            "pace": 75,
-            "tone": "confident",
-            "fillerWords": 3,
-            "confidence": 80
-        }
-        return {"success": True, "analysis": analysis}
+        audio_data = await file.read()
+        job_id = job_queue.submit(run_audio_analysis, audio_data)
+        return {"success": True, "jobId": job_id, "status": "queued"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Audio analysis failed: {str(e)}")
 
 @app.post("/analyze-video")
-async def analyze_video(video_data: bytes):
-    """Analyze video for facial expressions and body language"""
+async def analyze_video(file: UploadFile = File(...)):
+    """Queue video analysis and return a job id to poll at /jobs/{job_id}"""
     try:
-        # TODO: Implement video analysis with OpenCV and DeepFace
-        analysis = {
-            "eyeContact": 80,
-            "facialExpressions": ["confident", "engaged"],
-            "posture": "good",
-            "gestures": "appropriate"
-        }
-        return {"success": True, "analysis": analysis}
+        video_data = await file.read()
+        job_id = job_queue.submit(run_video_analysis, video_data)
+        return {"success": True, "jobId": job_id, "status": "queued"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Video analysis failed: {str(e)}")
 
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Return the status of a queued analysis and its result once completed"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"success": True, **job}
+
+@app.on_event("shutdown")
+async def shutdown_job_queue():
+    job_queue.shutdown()
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     uvicorn.run(app, host="0.0.0.0", port=port)
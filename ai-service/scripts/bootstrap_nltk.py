@@ -0,0 +1,23 @@
+"""Download the NLTK data used by the full AI service (main.py).
+
+Run once per environment, e.g. at image build or deploy time:
+
+    python scripts/bootstrap_nltk.py
+
+Then set AISVC_SKIP_NLTK=1 so ResumeParser skips its own download check at import.
+"""
+import nltk
+
+NLTK_PACKAGES = (
+    'vader_lexicon',  # AnswerAnalyzer sentiment scoring
+    'punkt',          # ResumeParser
+    'stopwords',      # ResumeParser
+)
+
+def main():
+    for package in NLTK_PACKAGES:
+        if not nltk.download(package, quiet=True):
+            raise SystemExit(f"Failed to download NLTK package '{package}'")
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,152 @@
+import math
+import os
 import re
-import nltk
-from typing import Dict, List
-from textstat import flesch_reading_ease, flesch_kincaid_grade
+import ahocorasick
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 import spacy
+from spacy.attrs import POS
+from spacy.symbols import ADJ, NOUN, VERB
+from spacy.tokens import Doc
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+@lru_cache(maxsize=256)
+def question_keywords(question: str) -> FrozenSet[str]:
+    """Distinct lower-cased words of a question; a session scores many answers against the same one"""
+    return frozenset(WORD_PATTERN.findall(question.lower()))
+
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+ALNUM_TOKEN_PATTERN = re.compile(r'\S*[^\W_]\S*')  # whitespace-delimited tokens holding a letter or digit
+NON_LETTER_PATTERN = re.compile(r'[^a-z]+')
+VOWEL_GROUP_PATTERN = re.compile(r'[aeiouy]+')
+
+@lru_cache(maxsize=4096)
+def count_syllables(word: str) -> int:
+    """Estimate syllables in a lower-case word from its vowel groups, dropping a silent final e or ed"""
+    letters = NON_LETTER_PATTERN.sub('', word)
+    count = len(VOWEL_GROUP_PATTERN.findall(letters))
+    if count > 1 and (
+        (letters.endswith('e') and not letters.endswith(('le', 'ee'))) or
+        (letters.endswith('ed') and not letters.endswith(('ted', 'ded')))
+    ):
+        count -= 1
+    return max(1, count)
+
+@lru_cache(maxsize=1024)
+def readability_scores(text: str) -> Tuple[float, float]:
+    """Flesch reading ease and Flesch-Kincaid grade from one shared word/sentence/syllable count"""
+    words = ALNUM_TOKEN_PATTERN.findall(text.lower())
+    if not words:
+        return 50.0, 10.0  # Default moderate score
+    
+    sentence_count = max(1, sum(1 for sentence in SENTENCE_END_PATTERN.split(text) if sentence.strip()))
+    syllable_count = sum(count_syllables(word) for word in words)
+    
+    words_per_sentence = len(words) / sentence_count
+    syllables_per_word = syllable_count / len(words)
+    
+    reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    grade_level = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    return round(reading_ease, 2), round(grade_level, 1)
+
+@dataclass(frozen=True)
+class PreparedAnswer:
+    """An answer with the lower-cased text, splits and keyword hits every analysis needs, computed once"""
+    text: str
+    lower: str
+    words: List[str]
+    word_count: int
+    segments: List[str]  # text split on '.'
+    sentence_count: int  # non-blank segments
+    phrases: FrozenSet[str]  # keyword phrases occurring anywhere in lower
+
+    @classmethod
+    def from_text(cls, text: str, phrase_automaton: ahocorasick.Automaton) -> 'PreparedAnswer':
+        words = text.split()
+        segments = text.split('.')
+        lower = text.lower()
+        phrases = frozenset(phrase for _, phrase in phrase_automaton.iter(lower))
+        return cls(
+            text=text, lower=lower, words=words, word_count=len(words), segments=segments,
+            sentence_count=sum(1 for segment in segments if segment.strip()), phrases=phrases
+        )
+
+# Models are loaded once per process and shared by every AnswerAnalyzer;
+# inference on both is read-only, so concurrent use is safe.
+# Answers shorter than this carry too little signal to repay the spaCy pipeline
+SPACY_MIN_WORDS = 30
+
+# "full" runs en_core_web_sm for POS tags and lemmas; "lite" runs a blank English
+# pipeline with rule-based sentence splitting only, a fraction of the memory and load time
+ANALYZER_TIER = os.getenv("ANALYZER_TIER", "full")
+
+@lru_cache(maxsize=1)
+def load_nlp() -> Optional[spacy.language.Language]:
+    """Load the spaCy pipeline for the configured tier, or None if its model isn't installed"""
+    if ANALYZER_TIER == "lite":
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        return nlp
+    
+    # Only POS tags, lemmas and sentence boundaries are used, so skip NER
+    # and let the small senter replace the parser.
+    try:
+        nlp = spacy.load("en_core_web_sm", exclude=["ner", "parser"])
+    except OSError:
+        print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+        return None
+    
+    if "senter" in nlp.component_names:
+        nlp.enable_pipe("senter")
+    else:
+        nlp.add_pipe("sentencizer")
+    return nlp
+
+SENTIMENT_TOKEN_PATTERN = re.compile(r"[a-z']+")
+
+@dataclass(frozen=True)
+class SentimentLexicon:
+    """VADER's word valences and negations, scored with a single pass over the answer"""
+    valences: Dict[str, float]
+    negations: FrozenSet[str]
+    negation_scalar: float = -0.74
+    negation_window: int = 3
+    alpha: float = 15  # VADER's normalisation constant
+
+    def compound(self, lower: str) -> float:
+        """Sum word valences, flipping words shortly after a negation, and normalise like VADER's compound"""
+        total = 0.0
+        last_negation = -self.negation_window - 1
+        for i, token in enumerate(SENTIMENT_TOKEN_PATTERN.findall(lower)):
+            valence = self.valences.get(token)
+            if valence is not None:
+                if i - last_negation <= self.negation_window:
+                    valence *= self.negation_scalar
+                total += valence
+            if token in self.negations:
+                last_negation = i
+        return total / math.sqrt(total * total + self.alpha)
+
+@lru_cache(maxsize=1)
+def load_sentiment_lexicon() -> Optional[SentimentLexicon]:
+    """Load NLTK's VADER lexicon, or None if it isn't installed"""
+    # The lexicon is downloaded ahead of time by scripts/bootstrap_nltk.py, never per instance
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+    try:
+        return SentimentLexicon(valences=SentimentIntensityAnalyzer().lexicon, negations=frozenset(VaderConstants.NEGATE))
+    except LookupError:
+        print("Warning: NLTK vader_lexicon not found. Install with: python scripts/bootstrap_nltk.py")
+        return None
 
 class AnswerAnalyzer:
     def __init__(self):
         # Load spaCy model for NLP analysis
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        self.nlp = load_nlp()
         
         # Initialize NLTK
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('vader_lexicon', quiet=True)
-            from nltk.sentiment import SentimentIntensityAnalyzer
-            self.sentiment_analyzer = SentimentIntensityAnalyzer()
-        except:
-            self.sentiment_analyzer = None
+        self.sentiment_lexicon = load_sentiment_lexicon()
         
         # Keywords for different aspects
         self.confidence_keywords = {
@@ -35,6 +161,54 @@ class AnswerAnalyzer:
             'testing': ['test', 'testing', 'unit test', 'integration', 'debugging'],
             'collaboration': ['team', 'collaborate', 'communication', 'meeting', 'review']
         }
+        
+        # Phrase lists scanned on every answer, built once here instead of per call
+        self.depth_indicators = ('because', 'therefore', 'however', 'additionally', 'furthermore', 'for example', 'such as')
+        self.example_phrases = ('for example', 'such as', 'like when', 'instance')
+        self.code_indicators = ('function', 'class', 'method', 'algorithm', 'data structure', 'database')
+        
+        # STAR method detection for behavioral questions
+        self.star_indicators = {
+            'situation': ('situation', 'context', 'background', 'when', 'where'),
+            'task': ('task', 'responsibility', 'goal', 'objective', 'needed to'),
+            'action': ('action', 'did', 'implemented', 'developed', 'created', 'decided'),
+            'result': ('result', 'outcome', 'achieved', 'improved', 'increased', 'successful')
+        }
+        self.flow_indicators = ('first', 'then', 'next', 'finally', 'in conclusion', 'therefore')
+        self.conclusion_phrases = ('in conclusion', 'to summarize', 'overall', 'in summary')
+        self.hedge_words = ('kind of', 'sort of', 'i think', 'i believe', 'probably', 'maybe')
+        
+        # Expected answer length (min, max words) by category
+        self.expected_lengths = {
+            'technical': (100, 300),
+            'behavioral': (150, 400),
+            'situational': (100, 250),
+            'general': (50, 200)
+        }
+        
+        self.role_terms = {
+            'software engineer': ['algorithm', 'data structure', 'api', 'framework', 'library', 'debugging'],
+            'frontend developer': ['responsive', 'dom', 'css', 'javascript', 'react', 'vue', 'angular'],
+            'backend developer': ['database', 'server', 'api', 'microservices', 'authentication', 'caching'],
+            'data scientist': ['model', 'dataset', 'analysis', 'statistics', 'machine learning', 'visualization'],
+            'devops engineer': ['deployment', 'infrastructure', 'monitoring', 'automation', 'pipeline', 'container']
+        }
+        self.default_role_terms = ['technology', 'system', 'solution', 'implementation', 'development']
+        
+        # Weight of each aspect in the overall score
+        self.score_weights = {
+            'content': 0.25,
+            'technical': 0.25,
+            'structure': 0.20,
+            'confidence': 0.15,
+            'completeness': 0.15
+        }
+        
+        # Every phrase above in one automaton, so a single scan finds all keyword hits
+        self.phrase_automaton = self._build_phrase_automaton()
+        
+        # Job roles repeat across a session, so remember which term list each one resolves to
+        self._get_role_technical_terms = lru_cache(maxsize=64)(self._get_role_technical_terms)
 
     def analyze(self, question: str, answer: str, category: str, job_role: str) -> Dict:
         """Analyze user's answer and return detailed analysis"""
@@ -42,13 +216,51 @@ class AnswerAnalyzer:
         if not answer or len(answer.strip()) < 10:
             return self._generate_insufficient_answer_analysis()
         
+        prep = PreparedAnswer.from_text(answer, self.phrase_automaton)
+        doc = self.nlp(answer) if self._should_parse(prep) else None
+        return self._analyze_parsed(question, prep, category, job_role, doc)
+
+    def analyze_batch(self, items: List[Tuple[str, str, str, str]]) -> List[Dict]:
+        """Analyze (question, answer, category, job_role) items, parsing the answers with one nlp.pipe call"""
+        
+        results = [None] * len(items)
+        prepared = []
+        for i, (_, answer, _, _) in enumerate(items):
+            if not answer or len(answer.strip()) < 10:
+                results[i] = self._generate_insufficient_answer_analysis()
+            else:
+                prepared.append((i, PreparedAnswer.from_text(answer, self.phrase_automaton)))
+        
+        to_parse = [(i, prep) for i, prep in prepared if self._should_parse(prep)]
+        docs = {}
+        if to_parse:
+            parsed_docs = self.nlp.pipe((prep.text for _, prep in to_parse), batch_size=32)
+            docs = {i: doc for (i, _), doc in zip(to_parse, parsed_docs)}
+        
+        for i, prep in prepared:
+            question, _, category, job_role = items[i]
+            results[i] = self._analyze_parsed(question, prep, category, job_role, docs.get(i))
+        
+        return results
+
+    def _should_parse(self, prep: PreparedAnswer) -> bool:
+        """Whether an answer goes through spaCy; short ones get the heuristic linguistics instead"""
+        return self.nlp is not None and prep.word_count >= SPACY_MIN_WORDS
+
+    def _analyze_parsed(self, question: str, prep: PreparedAnswer, category: str, job_role: str, doc: Optional[Doc]) -> Dict:
+        """Run every analysis for a prepared answer whose spaCy Doc (or None) is already available"""
+        
+        # Normalise the request labels once; the analyses below match them against lower-case tables
+        category = category.lower()
+        job_role = job_role.lower()
+        
         analysis = {
-            'content_analysis': self._analyze_content(answer, question, category),
-            'linguistic_analysis': self._analyze_linguistics(answer),
-            'technical_analysis': self._analyze_technical_content(answer, job_role),
-            'structure_analysis': self._analyze_structure(answer, category),
-            'confidence_analysis': self._analyze_confidence(answer),
-            'completeness_analysis': self._analyze_completeness(answer, question, category)
+            'content_analysis': self._analyze_content(prep, question, category),
+            'linguistic_analysis': self._analyze_linguistics(prep, doc),
+            'technical_analysis': self._analyze_technical_content(prep, job_role),
+            'structure_analysis': self._analyze_structure(prep, category),
+            'confidence_analysis': self._analyze_confidence(prep),
+            'completeness_analysis': self._analyze_completeness(prep, question, category)
         }
         
         # Calculate overall scores
@@ -56,62 +268,58 @@ class AnswerAnalyzer:
         
         return analysis
 
-    def _analyze_content(self, answer: str, question: str, category: str) -> Dict:
+    def _analyze_content(self, prep: PreparedAnswer, question: str, category: str) -> Dict:
         """Analyze the content relevance and quality"""
         
         # Basic metrics
-        word_count = len(answer.split())
-        sentence_count = len([s for s in answer.split('.') if s.strip()])
+        word_count = prep.word_count
+        sentence_count = prep.sentence_count
         
         # Keyword relevance
-        question_keywords = set(re.findall(r'\b\w+\b', question.lower()))
-        answer_keywords = set(re.findall(r'\b\w+\b', answer.lower()))
-        relevance_score = len(question_keywords.intersection(answer_keywords)) / max(len(question_keywords), 1) * 100
+        keywords = question_keywords(question)
+        matched = keywords.intersection(WORD_PATTERN.findall(prep.lower))
+        relevance_score = len(matched) / max(len(keywords), 1) * 100
         
         # Content depth indicators
-        depth_indicators = ['because', 'therefore', 'however', 'additionally', 'furthermore', 'for example', 'such as']
-        depth_score = sum(1 for indicator in depth_indicators if indicator in answer.lower()) * 10
+        depth_score = len(prep.phrases.intersection(self.depth_indicators)) * 10
         
         return {
             'word_count': word_count,
             'sentence_count': sentence_count,
             'relevance_score': min(100, relevance_score),
             'depth_score': min(100, depth_score),
-            'has_examples': any(phrase in answer.lower() for phrase in ['for example', 'such as', 'like when', 'instance'])
+            'has_examples': not prep.phrases.isdisjoint(self.example_phrases)
         }
 
-    def _analyze_linguistics(self, answer: str) -> Dict:
-        """Analyze linguistic quality of the answer"""
+    def _analyze_linguistics(self, prep: PreparedAnswer, doc: Optional[Doc]) -> Dict:
+        """Analyze linguistic quality of the answer, using its spaCy Doc when there is one"""
         
-        try:
-            # Readability scores
-            readability = flesch_reading_ease(answer)
-            grade_level = flesch_kincaid_grade(answer)
-        except:
-            readability = 50  # Default moderate score
-            grade_level = 10
+        # Readability scores
+        readability, grade_level = readability_scores(prep.text)
         
         # Grammar and complexity
-        if self.nlp:
-            doc = self.nlp(answer)
-            
-            # Count different types of words
-            nouns = len([token for token in doc if token.pos_ == 'NOUN'])
-            verbs = len([token for token in doc if token.pos_ == 'VERB'])
-            adjectives = len([token for token in doc if token.pos_ == 'ADJ'])
+        if doc is not None and doc.has_annotation("POS"):
+            # Count different types of words (tallied in C by count_by)
+            pos_counts = doc.count_by(POS)
+            nouns = pos_counts.get(NOUN, 0)
+            verbs = pos_counts.get(VERB, 0)
+            adjectives = pos_counts.get(ADJ, 0)
             
             # Sentence complexity
-            avg_sentence_length = len(doc) / max(len(list(doc.sents)), 1)
+            avg_sentence_length = len(doc) / max(sum(1 for _ in doc.sents), 1)
             
-            vocabulary_diversity = len(set([token.lemma_.lower() for token in doc if token.is_alpha])) / max(len(doc), 1)
+            vocabulary_diversity = len({token.lemma_.lower() for token in doc if token.is_alpha}) / max(len(doc), 1)
+        elif doc is not None:
+            # Lite tier: spaCy tokens and sentences, but no tagger, so word types come from suffixes
+            nouns, verbs, adjectives = self._count_word_types_by_suffix(prep.words)
+            avg_sentence_length = len(doc) / max(sum(1 for _ in doc.sents), 1)
+            vocabulary_diversity = len({token.lower_ for token in doc if token.is_alpha}) / max(len(doc), 1)
         else:
             # Fallback analysis
-            words = answer.split()
-            nouns = len([w for w in words if w.endswith('tion') or w.endswith('ness')])
-            verbs = len([w for w in words if w.endswith('ed') or w.endswith('ing')])
-            adjectives = len([w for w in words if w.endswith('ly')])
-            avg_sentence_length = len(words) / max(len(answer.split('.')), 1)
-            vocabulary_diversity = len(set(words)) / max(len(words), 1)
+            words = prep.words
+            nouns, verbs, adjectives = self._count_word_types_by_suffix(words)
+            avg_sentence_length = prep.word_count / max(len(prep.segments), 1)
+            vocabulary_diversity = len(set(words)) / max(prep.word_count, 1)
         
         return {
             'readability_score': max(0, min(100, readability)),
@@ -125,25 +333,29 @@ class AnswerAnalyzer:
             }
         }
 
-    def _analyze_technical_content(self, answer: str, job_role: str) -> Dict:
+    def _count_word_types_by_suffix(self, words: List[str]) -> Tuple[int, int, int]:
+        """Rough noun, verb and adjective counts from word endings, for when there is no POS tagger"""
+        nouns = len([w for w in words if w.endswith('tion') or w.endswith('ness')])
+        verbs = len([w for w in words if w.endswith('ed') or w.endswith('ing')])
+        adjectives = len([w for w in words if w.endswith('ly')])
+        return nouns, verbs, adjectives
+
+    def _analyze_technical_content(self, prep: PreparedAnswer, job_role: str) -> Dict:
         """Analyze technical depth and accuracy"""
         
-        answer_lower = answer.lower()
-        
         # Count technical keywords by category
         technical_scores = {}
         for category, keywords in self.technical_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in answer_lower)
+            score = len(prep.phrases.intersection(keywords))
             technical_scores[category] = min(100, score * 20)
         
         # Role-specific technical terms
         role_terms = self._get_role_technical_terms(job_role)
-        role_term_count = sum(1 for term in role_terms if term in answer_lower)
+        role_term_count = len(prep.phrases.intersection(role_terms))
         role_technical_score = min(100, role_term_count * 15)
         
         # Code or technical examples
-        has_code_example = any(indicator in answer_lower for indicator in 
-                              ['function', 'class', 'method', 'algorithm', 'data structure', 'database'])
+        has_code_example = not prep.phrases.isdisjoint(self.code_indicators)
         
         return {
             'technical_categories': technical_scores,
@@ -152,36 +364,27 @@ class AnswerAnalyzer:
             'overall_technical_score': sum(technical_scores.values()) / max(len(technical_scores), 1)
         }
 
-    def _analyze_structure(self, answer: str, category: str) -> Dict:
+    def _analyze_structure(self, prep: PreparedAnswer, category: str) -> Dict:
         """Analyze answer structure and organization"""
         
         # STAR method detection for behavioral questions
-        star_indicators = {
-            'situation': ['situation', 'context', 'background', 'when', 'where'],
-            'task': ['task', 'responsibility', 'goal', 'objective', 'needed to'],
-            'action': ['action', 'did', 'implemented', 'developed', 'created', 'decided'],
-            'result': ['result', 'outcome', 'achieved', 'improved', 'increased', 'successful']
-        }
-        
         star_score = 0
         star_components = {}
         
         if category == 'behavioral':
-            answer_lower = answer.lower()
-            for component, indicators in star_indicators.items():
-                has_component = any(indicator in answer_lower for indicator in indicators)
+            for component, indicators in self.star_indicators.items():
+                has_component = not prep.phrases.isdisjoint(indicators)
                 star_components[component] = has_component
                 if has_component:
                     star_score += 25
         
         # Logical flow indicators
-        flow_indicators = ['first', 'then', 'next', 'finally', 'in conclusion', 'therefore']
-        has_logical_flow = sum(1 for indicator in flow_indicators if indicator in answer.lower()) > 0
+        has_logical_flow = not prep.phrases.isdisjoint(self.flow_indicators)
         
         # Introduction and conclusion
-        has_introduction = len(answer.split('.')[0]) > 20 if '.' in answer else False
-        has_conclusion = any(phrase in answer.lower()[-100:] for phrase in 
-                           ['in conclusion', 'to summarize', 'overall', 'in summary'])
+        has_introduction = len(prep.segments) > 1 and len(prep.segments[0]) > 20
+        ending = prep.lower[-100:]
+        has_conclusion = any(phrase in ending for phrase in self.conclusion_phrases)
         
         return {
             'star_score': star_score,
@@ -193,30 +396,24 @@ class AnswerAnalyzer:
                               (15 if has_introduction else 0) + (10 if has_conclusion else 0))
         }
 
-    def _analyze_confidence(self, answer: str) -> Dict:
+    def _analyze_confidence(self, prep: PreparedAnswer) -> Dict:
         """Analyze confidence level in the answer"""
         
-        answer_lower = answer.lower()
-        
         # Count confidence indicators
-        high_confidence = sum(1 for word in self.confidence_keywords['high'] if word in answer_lower)
-        low_confidence = sum(1 for word in self.confidence_keywords['low'] if word in answer_lower)
+        high_confidence = len(prep.phrases.intersection(self.confidence_keywords['high']))
+        low_confidence = len(prep.phrases.intersection(self.confidence_keywords['low']))
         
         # Hedge words and filler words
-        hedge_words = ['kind of', 'sort of', 'i think', 'i believe', 'probably', 'maybe']
-        hedge_count = sum(1 for phrase in hedge_words if phrase in answer_lower)
+        hedge_count = len(prep.phrases.intersection(self.hedge_words))
         
         # Calculate confidence score
         confidence_score = max(0, min(100, (high_confidence * 15) - (low_confidence * 10) - (hedge_count * 5) + 50))
         
         # Sentiment analysis
         sentiment_score = 50  # Default neutral
-        if self.sentiment_analyzer:
-            try:
-                sentiment = self.sentiment_analyzer.polarity_scores(answer)
-                sentiment_score = max(0, min(100, (sentiment['compound'] + 1) * 50))
-            except:
-                pass
+        if self.sentiment_lexicon:
+            compound = self.sentiment_lexicon.compound(prep.lower)
+            sentiment_score = max(0, min(100, (compound + 1) * 50))
         
         return {
             'confidence_score': confidence_score,
@@ -226,20 +423,13 @@ class AnswerAnalyzer:
             'sentiment_score': sentiment_score
         }
 
-    def _analyze_completeness(self, answer: str, question: str, category: str) -> Dict:
+    def _analyze_completeness(self, prep: PreparedAnswer, question: str, category: str) -> Dict:
         """Analyze how complete the answer is"""
         
-        word_count = len(answer.split())
+        word_count = prep.word_count
         
         # Expected length by category
-        expected_lengths = {
-            'technical': (100, 300),
-            'behavioral': (150, 400),
-            'situational': (100, 250),
-            'general': (50, 200)
-        }
-        
-        min_length, max_length = expected_lengths.get(category, (100, 250))
+        min_length, max_length = self.expected_lengths.get(category, (100, 250))
         
         # Length appropriateness
         if word_count < min_length:
@@ -254,7 +444,7 @@ class AnswerAnalyzer:
         question_parts = max(1, question_parts)
         
         # Simple heuristic for addressing multiple parts
-        addresses_all_parts = len(answer.split('.')) >= question_parts
+        addresses_all_parts = len(prep.segments) >= question_parts
         
         return {
             'word_count': word_count,
@@ -263,17 +453,26 @@ class AnswerAnalyzer:
             'completeness_score': (length_score + (20 if addresses_all_parts else 0)) / 1.2
         }
 
+    def _build_phrase_automaton(self) -> ahocorasick.Automaton:
+        """Build an Aho-Corasick automaton over every keyword phrase the analyses test for"""
+        phrase_lists = [
+            self.depth_indicators, self.example_phrases, self.code_indicators,
+            self.flow_indicators, self.hedge_words, self.default_role_terms,
+            *self.confidence_keywords.values(), *self.technical_keywords.values(),
+            *self.star_indicators.values(), *self.role_terms.values()
+        ]
+        
+        automaton = ahocorasick.Automaton()
+        for phrases in phrase_lists:
+            for phrase in phrases:
+                automaton.add_word(phrase, phrase)
+        automaton.make_automaton()
+        return automaton
+
     def _calculate_scores(self, analysis: Dict) -> Dict:
         """Calculate overall scores from analysis"""
         
-        # Weight different aspects
-        weights = {
-            'content': 0.25,
-            'technical': 0.25,
-            'structure': 0.20,
-            'confidence': 0.15,
-            'completeness': 0.15
-        }
+        weights = self.score_weights
         
         # Extract key scores
         content_score = (analysis['content_analysis']['relevance_score'] + 
@@ -323,19 +522,10 @@ class AnswerAnalyzer:
             }
         }
 
-    def _get_role_technical_terms(self, job_role: str) -> List[str]:
-        """Get technical terms specific to job role"""
-        role_terms = {
-            'software engineer': ['algorithm', 'data structure', 'api', 'framework', 'library', 'debugging'],
-            'frontend developer': ['responsive', 'dom', 'css', 'javascript', 'react', 'vue', 'angular'],
-            'backend developer': ['database', 'server', 'api', 'microservices', 'authentication', 'caching'],
-            'data scientist': ['model', 'dataset', 'analysis', 'statistics', 'machine learning', 'visualization'],
-            'devops engineer': ['deployment', 'infrastructure', 'monitoring', 'automation', 'pipeline', 'container']
-        }
-        
-        role_lower = job_role.lower()
-        for role, terms in role_terms.items():
+    def _get_role_technical_terms(self, role_lower: str) -> List[str]:
+        """Get technical terms specific to a lower-cased job role"""
+        for role, terms in self.role_terms.items():
             if role in role_lower:
                 return terms
         
-        return ['technology', 'system', 'solution', 'implementation', 'development']
+        return self.default_role_terms
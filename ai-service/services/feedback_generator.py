@@ -1,106 +1,217 @@
-from typing import Dict, List
+from bisect import bisect_right
+from operator import eq, ge, gt, lt
+from typing import Dict, List, Tuple
 import random
 
+class TemplateId:
+    """Index of each feedback template group in _TEMPLATES"""
+    HIGH_TECHNICAL = 0
+    GOOD_STRUCTURE = 1
+    HIGH_CONFIDENCE = 2
+    GOOD_EXAMPLES = 3
+    COMPREHENSIVE = 4
+    LOW_TECHNICAL = 5
+    POOR_STRUCTURE = 6
+    LOW_CONFIDENCE = 7
+    INSUFFICIENT_EXAMPLES = 8
+    INCOMPLETE = 9
+    TOO_BRIEF = 10
+    TOO_VERBOSE = 11
+    TECHNICAL_IMPROVEMENT = 12
+    COMMUNICATION_IMPROVEMENT = 13
+    PREPARATION_TIPS = 14
+    STAR_METHOD = 15
+    FEWER_HEDGES = 16
+
+T = TemplateId
+
+# One tuple of interchangeable phrasings per TemplateId, in id order. Built once at import.
+_TEMPLATES = (
+    # HIGH_TECHNICAL
+    (
+        "Excellent technical depth and accuracy in your response",
+        "Strong demonstration of technical knowledge and expertise",
+        "Impressive understanding of technical concepts and implementation",
+        "Great technical insight and practical application knowledge",
+    ),
+    # GOOD_STRUCTURE
+    (
+        "Well-structured and organized response",
+        "Clear logical flow in your explanation",
+        "Excellent use of the STAR method for storytelling",
+        "Good progression from problem to solution",
+    ),
+    # HIGH_CONFIDENCE
+    (
+        "Confident and assured delivery",
+        "Strong conviction in your responses",
+        "Excellent communication confidence",
+        "Clear and decisive communication style",
+    ),
+    # GOOD_EXAMPLES
+    (
+        "Great use of specific examples and real-world scenarios",
+        "Excellent concrete examples that illustrate your points",
+        "Strong practical examples that demonstrate experience",
+        "Good use of case studies and specific instances",
+    ),
+    # COMPREHENSIVE
+    (
+        "Comprehensive and thorough response",
+        "Complete coverage of all question aspects",
+        "Detailed and well-rounded answer",
+        "Thorough exploration of the topic",
+    ),
+    # LOW_TECHNICAL
+    (
+        "Consider adding more technical details and depth",
+        "Include more specific technical examples and implementations",
+        "Expand on the technical aspects of your solution",
+        "Provide more detailed technical reasoning",
+    ),
+    # POOR_STRUCTURE
+    (
+        "Try to organize your response with a clearer structure",
+        "Consider using the STAR method for behavioral questions",
+        "Improve the logical flow of your explanation",
+        "Structure your answer with clear beginning, middle, and end",
+    ),
+    # LOW_CONFIDENCE
+    (
+        "Speak with more confidence and conviction",
+        "Reduce hedge words like 'maybe' and 'I think'",
+        "Be more assertive in your responses",
+        "Practice speaking with greater certainty",
+    ),
+    # INSUFFICIENT_EXAMPLES
+    (
+        "Include more specific examples from your experience",
+        "Add concrete scenarios to illustrate your points",
+        "Provide real-world examples to support your answers",
+        "Use more detailed case studies and specific instances",
+    ),
+    # INCOMPLETE
+    (
+        "Provide more comprehensive coverage of the question",
+        "Address all parts of the multi-part question",
+        "Expand your response to be more thorough",
+        "Include more detail to fully answer the question",
+    ),
+    # TOO_BRIEF
+    (
+        "Expand your response with more detail and examples",
+        "Provide a more comprehensive answer",
+        "Add more depth to your explanation",
+        "Include additional context and background",
+    ),
+    # TOO_VERBOSE
+    (
+        "Try to be more concise while maintaining key points",
+        "Focus on the most important aspects of your answer",
+        "Streamline your response for better clarity",
+        "Practice delivering more focused responses",
+    ),
+    # TECHNICAL_IMPROVEMENT
+    (
+        "Practice explaining technical concepts in simple terms",
+        "Prepare specific examples of your technical work",
+        "Study common technical interview questions for your role",
+        "Practice whiteboarding and code explanation",
+    ),
+    # COMMUNICATION_IMPROVEMENT
+    (
+        "Practice the STAR method for behavioral questions",
+        "Work on speaking with more confidence and less hesitation",
+        "Practice structuring your responses clearly",
+        "Record yourself answering questions to improve delivery",
+    ),
+    # PREPARATION_TIPS
+    (
+        "Research the company and role more thoroughly",
+        "Prepare more specific examples from your experience",
+        "Practice common interview questions for your field",
+        "Review your resume and be ready to discuss each point",
+    ),
+    # STAR_METHOD
+    (
+        "Practice using the STAR method (Situation, Task, Action, Result) for behavioral questions",
+    ),
+    # FEWER_HEDGES
+    (
+        "Reduce filler words and hedge phrases to sound more confident",
+    ),
+)
+
+# Group names for debugging, parallel to _TEMPLATES
+_TEMPLATE_NAMES = (
+    'strengths.high_technical',
+    'strengths.good_structure',
+    'strengths.high_confidence',
+    'strengths.good_examples',
+    'strengths.comprehensive',
+    'improvements.low_technical',
+    'improvements.poor_structure',
+    'improvements.low_confidence',
+    'improvements.insufficient_examples',
+    'improvements.incomplete',
+    'improvements.too_brief',
+    'improvements.too_verbose',
+    'suggestions.technical_improvement',
+    'suggestions.communication_improvement',
+    'suggestions.preparation_tips',
+    'suggestions.star_method',
+    'suggestions.fewer_hedges',
+)
+
 class FeedbackGenerator:
+    # The only per-instance state is the random generator; everything else is class or module level
+    __slots__ = ('_rng', '_choice', '_getrandbits')
+
+    # (analysis section, field, comparison, threshold, template id), checked in order.
+    # The order decides which messages survive the per-list cap, so keep it stable.
+    _STRENGTH_RULES = (
+        ('scores', 'technical_score', ge, 75, T.HIGH_TECHNICAL),
+        ('scores', 'structure_score', ge, 70, T.GOOD_STRUCTURE),
+        ('scores', 'confidence_score', ge, 75, T.HIGH_CONFIDENCE),
+        ('content_analysis', 'has_examples', eq, True, T.GOOD_EXAMPLES),
+        ('scores', 'completeness_score', ge, 80, T.COMPREHENSIVE),
+    )
+
+    _IMPROVEMENT_RULES = (
+        ('scores', 'technical_score', lt, 50, T.LOW_TECHNICAL),
+        ('scores', 'structure_score', lt, 50, T.POOR_STRUCTURE),
+        ('scores', 'confidence_score', lt, 60, T.LOW_CONFIDENCE),
+        ('content_analysis', 'has_examples', eq, False, T.INSUFFICIENT_EXAMPLES),
+        ('content_analysis', 'word_count', lt, 50, T.TOO_BRIEF),
+        ('content_analysis', 'word_count', gt, 400, T.TOO_VERBOSE),
+        ('scores', 'completeness_score', lt, 60, T.INCOMPLETE),
+    )
+
+    # A template listed twice fires at most once, which is how "either score is low" is written
+    _SUGGESTION_RULES = (
+        ('scores', 'technical_score', lt, 70, T.TECHNICAL_IMPROVEMENT),
+        ('scores', 'communication_score', lt, 70, T.COMMUNICATION_IMPROVEMENT),
+        ('scores', 'structure_score', lt, 60, T.COMMUNICATION_IMPROVEMENT),
+        ('scores', 'overall_score', lt, 70, T.PREPARATION_TIPS),
+        ('structure_analysis', 'star_score', lt, 50, T.STAR_METHOD),
+        ('confidence_analysis', 'hedge_word_count', gt, 3, T.FEWER_HEDGES),
+    )
+
+    # Average-score bands: below 60, 60-70, 70-80 and 80+, indexed with bisect_right
+    _PERFORMANCE_THRESHOLDS = (60, 70, 80)
+    _PERFORMANCE_LABELS = ("needs improvement", "satisfactory", "good", "excellent")
+    _PERFORMANCE_RECOMMENDATIONS = (
+        "Significant improvement needed. Consider more practice and preparation.",
+        "Solid foundation but focus on strengthening weaker areas.",
+        "Good performance with room for improvement in specific areas.",
+        "Excellent performance! You're well-prepared for interviews at this level.",
+    )
+
     def __init__(self):
-        self.feedback_templates = {
-            'strengths': {
-                'high_technical': [
-                    "Excellent technical depth and accuracy in your response",
-                    "Strong demonstration of technical knowledge and expertise",
-                    "Impressive understanding of technical concepts and implementation",
-                    "Great technical insight and practical application knowledge"
-                ],
-                'good_structure': [
-                    "Well-structured and organized response",
-                    "Clear logical flow in your explanation",
-                    "Excellent use of the STAR method for storytelling",
-                    "Good progression from problem to solution"
-                ],
-                'high_confidence': [
-                    "Confident and assured delivery",
-                    "Strong conviction in your responses",
-                    "Excellent communication confidence",
-                    "Clear and decisive communication style"
-                ],
-                'good_examples': [
-                    "Great use of specific examples and real-world scenarios",
-                    "Excellent concrete examples that illustrate your points",
-                    "Strong practical examples that demonstrate experience",
-                    "Good use of case studies and specific instances"
-                ],
-                'comprehensive': [
-                    "Comprehensive and thorough response",
-                    "Complete coverage of all question aspects",
-                    "Detailed and well-rounded answer",
-                    "Thorough exploration of the topic"
-                ]
-            },
-            'improvements': {
-                'low_technical': [
-                    "Consider adding more technical details and depth",
-                    "Include more specific technical examples and implementations",
-                    "Expand on the technical aspects of your solution",
-                    "Provide more detailed technical reasoning"
-                ],
-                'poor_structure': [
-                    "Try to organize your response with a clearer structure",
-                    "Consider using the STAR method for behavioral questions",
-                    "Improve the logical flow of your explanation",
-                    "Structure your answer with clear beginning, middle, and end"
-                ],
-                'low_confidence': [
-                    "Speak with more confidence and conviction",
-                    "Reduce hedge words like 'maybe' and 'I think'",
-                    "Be more assertive in your responses",
-                    "Practice speaking with greater certainty"
-                ],
-                'insufficient_examples': [
-                    "Include more specific examples from your experience",
-                    "Add concrete scenarios to illustrate your points",
-                    "Provide real-world examples to support your answers",
-                    "Use more detailed case studies and specific instances"
-                ],
-                'incomplete': [
-                    "Provide more comprehensive coverage of the question",
-                    "Address all parts of the multi-part question",
-                    "Expand your response to be more thorough",
-                    "Include more detail to fully answer the question"
-                ],
-                'too_brief': [
-                    "Expand your response with more detail and examples",
-                    "Provide a more comprehensive answer",
-                    "Add more depth to your explanation",
-                    "Include additional context and background"
-                ],
-                'too_verbose': [
-                    "Try to be more concise while maintaining key points",
-                    "Focus on the most important aspects of your answer",
-                    "Streamline your response for better clarity",
-                    "Practice delivering more focused responses"
-                ]
-            },
-            'suggestions': {
-                'technical_improvement': [
-                    "Practice explaining technical concepts in simple terms",
-                    "Prepare specific examples of your technical work",
-                    "Study common technical interview questions for your role",
-                    "Practice whiteboarding and code explanation"
-                ],
-                'communication_improvement': [
-                    "Practice the STAR method for behavioral questions",
-                    "Work on speaking with more confidence and less hesitation",
-                    "Practice structuring your responses clearly",
-                    "Record yourself answering questions to improve delivery"
-                ],
-                'preparation_tips': [
-                    "Research the company and role more thoroughly",
-                    "Prepare more specific examples from your experience",
-                    "Practice common interview questions for your field",
-                    "Review your resume and be ready to discuss each point"
-                ]
-            }
-        }
+        # One generator per instance instead of the random module's shared global one
+        self._rng = random.Random()
+        self._choice = self._rng.choice
+        self._getrandbits = self._rng.getrandbits
 
     def generate_feedback(self, analysis: Dict) -> Dict:
         """Generate comprehensive feedback based on answer analysis"""
@@ -113,9 +224,12 @@ class FeedbackGenerator:
         suggestions = self._generate_suggestions(analysis)
         
         # Calculate component scores
-        technical_accuracy = min(100, scores['technical_score'])
-        communication = min(100, scores['communication_score'])
-        confidence = min(100, scores['confidence_score'])
+        technical_accuracy = scores['technical_score']
+        technical_accuracy = technical_accuracy if technical_accuracy < 100 else 100
+        communication = scores['communication_score']
+        communication = communication if communication < 100 else 100
+        confidence = scores['confidence_score']
+        confidence = confidence if confidence < 100 else 100
         
         return {
             'score': int(scores['overall_score']),
@@ -135,109 +249,80 @@ class FeedbackGenerator:
 
     def _identify_strengths(self, analysis: Dict) -> List[str]:
         """Identify strengths based on analysis scores"""
-        strengths = []
-        scores = analysis['scores']
-        
-        # Technical strengths
-        if scores['technical_score'] >= 75:
-            strengths.append(random.choice(self.feedback_templates['strengths']['high_technical']))
-        
-        # Structure strengths
-        if scores['structure_score'] >= 70:
-            strengths.append(random.choice(self.feedback_templates['strengths']['good_structure']))
-        
-        # Confidence strengths
-        if scores['confidence_score'] >= 75:
-            strengths.append(random.choice(self.feedback_templates['strengths']['high_confidence']))
-        
-        # Examples and completeness
-        if analysis['content_analysis'].get('has_examples', False):
-            strengths.append(random.choice(self.feedback_templates['strengths']['good_examples']))
-        
-        if scores['completeness_score'] >= 80:
-            strengths.append(random.choice(self.feedback_templates['strengths']['comprehensive']))
+        strengths = self._apply_rules(analysis, self._STRENGTH_RULES, 3)  # Limit to top 3 strengths
         
         # Ensure at least one strength
         if not strengths:
-            if scores['overall_score'] >= 50:
+            if analysis['scores']['overall_score'] >= 50:
                 strengths.append("Good effort in addressing the question")
             else:
                 strengths.append("Thank you for providing a response")
         
-        return strengths[:3]  # Limit to top 3 strengths
+        return strengths
 
     def _identify_improvements(self, analysis: Dict) -> List[str]:
         """Identify areas for improvement based on analysis"""
-        improvements = []
-        scores = analysis['scores']
-        content = analysis['content_analysis']
-        
-        # Technical improvements
-        if scores['technical_score'] < 50:
-            improvements.append(random.choice(self.feedback_templates['improvements']['low_technical']))
-        
-        # Structure improvements
-        if scores['structure_score'] < 50:
-            improvements.append(random.choice(self.feedback_templates['improvements']['poor_structure']))
-        
-        # Confidence improvements
-        if scores['confidence_score'] < 60:
-            improvements.append(random.choice(self.feedback_templates['improvements']['low_confidence']))
-        
-        # Examples and completeness
-        if not content.get('has_examples', False):
-            improvements.append(random.choice(self.feedback_templates['improvements']['insufficient_examples']))
-        
-        # Length-based improvements
-        word_count = content.get('word_count', 0)
-        if word_count < 50:
-            improvements.append(random.choice(self.feedback_templates['improvements']['too_brief']))
-        elif word_count > 400:
-            improvements.append(random.choice(self.feedback_templates['improvements']['too_verbose']))
-        
-        # Completeness
-        if scores['completeness_score'] < 60:
-            improvements.append(random.choice(self.feedback_templates['improvements']['incomplete']))
-        
-        return improvements[:3]  # Limit to top 3 improvements
+        return self._apply_rules(analysis, self._IMPROVEMENT_RULES, 3)  # Limit to top 3 improvements
 
     def _generate_suggestions(self, analysis: Dict) -> List[str]:
         """Generate actionable suggestions for improvement"""
-        suggestions = []
-        scores = analysis['scores']
-        
-        # Technical suggestions
-        if scores['technical_score'] < 70:
-            suggestions.append(random.choice(self.feedback_templates['suggestions']['technical_improvement']))
-        
-        # Communication suggestions
-        if scores['communication_score'] < 70 or scores['structure_score'] < 60:
-            suggestions.append(random.choice(self.feedback_templates['suggestions']['communication_improvement']))
-        
-        # General preparation suggestions
-        if scores['overall_score'] < 70:
-            suggestions.append(random.choice(self.feedback_templates['suggestions']['preparation_tips']))
-        
-        # Specific suggestions based on analysis
-        if analysis['structure_analysis']['star_score'] < 50:
-            suggestions.append("Practice using the STAR method (Situation, Task, Action, Result) for behavioral questions")
-        
-        if analysis['confidence_analysis']['hedge_word_count'] > 3:
-            suggestions.append("Reduce filler words and hedge phrases to sound more confident")
+        suggestions = self._apply_rules(analysis, self._SUGGESTION_RULES, 4)  # Limit to top 4 suggestions
         
         # Ensure at least one suggestion
         if not suggestions:
             suggestions.append("Continue practicing interview questions to build confidence and improve responses")
         
-        return suggestions[:4]  # Limit to top 4 suggestions
+        return suggestions
+
+    def _apply_rules(self, analysis: Dict, rules: Tuple, limit: int) -> List[str]:
+        """Pick one template for each rule that fires, in table order, up to limit"""
+        fired = []
+        for section, key, op, threshold, template_id in rules:
+            # Missing values count as 0, so partial analyses (e.g. insufficient answers) still get feedback
+            if template_id not in fired and op(analysis[section].get(key, 0), threshold):
+                fired.append(template_id)
+                if len(fired) == limit:
+                    break
+        
+        # Most groups have exactly 4 phrasings, so 2 random bits pick one uniformly
+        # without the rejection loop inside Random.choice
+        choice = self._choice
+        getrandbits = self._getrandbits
+        picks = []
+        for template_id in fired:
+            templates = _TEMPLATES[template_id]
+            picks.append(templates[getrandbits(2)] if len(templates) == 4 else choice(templates))
+        return picks
 
     def generate_interview_summary(self, interview_data: Dict) -> Dict:
         """Generate overall interview summary and feedback"""
         
         questions = interview_data.get('questions', [])
-        answered_questions = [q for q in questions if q.get('feedback')]
         
-        if not answered_questions:
+        # Average the scores and keep the first 5 distinct strengths and improvements,
+        # in the order they were given, in one pass over the questions
+        answered_count = 0
+        total_score = total_technical = total_communication = total_confidence = 0
+        unique_strengths = {}
+        unique_improvements = {}
+        
+        for q in questions:
+            feedback = q.get('feedback')
+            if not feedback:
+                continue
+            
+            answered_count += 1
+            total_score += feedback['score']
+            total_technical += feedback.get('technicalAccuracy', 0)
+            total_communication += feedback.get('communication', 0)
+            total_confidence += feedback.get('confidence', 0)
+            
+            if len(unique_strengths) < 5:
+                self._collect_unique(unique_strengths, feedback.get('strengths', ()), 5)
+            if len(unique_improvements) < 5:
+                self._collect_unique(unique_improvements, feedback.get('improvements', ()), 5)
+        
+        if not answered_count:
             return {
                 'summary': "Interview not completed",
                 'overall_score': 0,
@@ -246,30 +331,16 @@ class FeedbackGenerator:
                 'recommendations': []
             }
         
-        # Calculate averages
-        avg_score = sum(q['feedback']['score'] for q in answered_questions) / len(answered_questions)
-        avg_technical = sum(q['feedback'].get('technicalAccuracy', 0) for q in answered_questions) / len(answered_questions)
-        avg_communication = sum(q['feedback'].get('communication', 0) for q in answered_questions) / len(answered_questions)
-        avg_confidence = sum(q['feedback'].get('confidence', 0) for q in answered_questions) / len(answered_questions)
-        
-        # Collect all strengths and improvements
-        all_strengths = []
-        all_improvements = []
-        
-        for q in answered_questions:
-            feedback = q['feedback']
-            all_strengths.extend(feedback.get('strengths', []))
-            all_improvements.extend(feedback.get('improvements', []))
-        
-        # Get unique strengths and improvements
-        unique_strengths = list(set(all_strengths))[:5]
-        unique_improvements = list(set(all_improvements))[:5]
+        avg_score = total_score / answered_count
+        avg_technical = total_technical / answered_count
+        avg_communication = total_communication / answered_count
+        avg_confidence = total_confidence / answered_count
         
         # Generate overall recommendations
         recommendations = self._generate_interview_recommendations(avg_score, avg_technical, avg_communication)
         
         # Generate summary text
-        summary = self._generate_summary_text(len(answered_questions), len(questions), avg_score)
+        summary = self._generate_summary_text(answered_count, len(questions), avg_score)
         
         return {
             'summary': summary,
@@ -277,25 +348,23 @@ class FeedbackGenerator:
             'technical_score': int(avg_technical),
             'communication_score': int(avg_communication),
             'confidence_score': int(avg_confidence),
-            'strengths': unique_strengths,
-            'areas_for_improvement': unique_improvements,
+            'strengths': list(unique_strengths),
+            'areas_for_improvement': list(unique_improvements),
             'recommendations': recommendations,
-            'questions_answered': len(answered_questions),
+            'questions_answered': answered_count,
             'total_questions': len(questions)
         }
 
+    def _collect_unique(self, seen: Dict, items, limit: int):
+        """Add items to the insertion-ordered seen dict until it holds limit entries"""
+        for item in items:
+            if len(seen) >= limit:
+                return
+            seen.setdefault(item)
+
     def _generate_interview_recommendations(self, avg_score: float, avg_technical: float, avg_communication: float) -> List[str]:
         """Generate overall interview recommendations"""
-        recommendations = []
-        
-        if avg_score >= 80:
-            recommendations.append("Excellent performance! You're well-prepared for interviews at this level.")
-        elif avg_score >= 70:
-            recommendations.append("Good performance with room for improvement in specific areas.")
-        elif avg_score >= 60:
-            recommendations.append("Solid foundation but focus on strengthening weaker areas.")
-        else:
-            recommendations.append("Significant improvement needed. Consider more practice and preparation.")
+        recommendations = [self._PERFORMANCE_RECOMMENDATIONS[bisect_right(self._PERFORMANCE_THRESHOLDS, avg_score)]]
         
         if avg_technical < 70:
             recommendations.append("Focus on strengthening technical knowledge and practice coding problems.")
@@ -310,15 +379,7 @@ class FeedbackGenerator:
     def _generate_summary_text(self, answered: int, total: int, avg_score: float) -> str:
         """Generate interview summary text"""
         completion_rate = (answered / total) * 100 if total > 0 else 0
-        
-        if avg_score >= 80:
-            performance = "excellent"
-        elif avg_score >= 70:
-            performance = "good"
-        elif avg_score >= 60:
-            performance = "satisfactory"
-        else:
-            performance = "needs improvement"
+        performance = self._PERFORMANCE_LABELS[bisect_right(self._PERFORMANCE_THRESHOLDS, avg_score)]
         
         return (f"You completed {answered} out of {total} questions ({completion_rate:.0f}% completion rate) "
                 f"with an average score of {avg_score:.0f}%. Your overall performance was {performance}. "
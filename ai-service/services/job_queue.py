@@ -0,0 +1,50 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+class JobQueue:
+    """Run slow analyses off the request path and let clients poll for results by job id"""
+
+    def __init__(self, max_workers: int = 2, max_jobs: int = 1000):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis-job")
+        self._jobs: "OrderedDict[str, Future]" = OrderedDict()
+        self._max_jobs = max_jobs
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable, *args) -> str:
+        """Queue func(*args) and return the id to poll it with"""
+        job_id = uuid.uuid4().hex
+        future = self._executor.submit(func, *args)
+
+        with self._lock:
+            self._jobs[job_id] = future
+            # Forget the oldest finished jobs once the table is full
+            while len(self._jobs) > self._max_jobs:
+                oldest_id, oldest = next(iter(self._jobs.items()))
+                if not oldest.done():
+                    break
+                del self._jobs[oldest_id]
+
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return the job's status and, once finished, its result or error"""
+        with self._lock:
+            future = self._jobs.get(job_id)
+
+        if future is None:
+            return None
+
+        if not future.done():
+            return {'jobId': job_id, 'status': 'running' if future.running() else 'queued'}
+
+        error = future.exception()
+        if error is not None:
+            return {'jobId': job_id, 'status': 'failed', 'error': str(error)}
+
+        return {'jobId': job_id, 'status': 'completed', 'result': future.result()}
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,26 +1,58 @@
+import copy
+import hashlib
+import os
 import re
-import spacy
-import nltk
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from typing import Dict, List
-from sklearn.feature_extraction.text import TfidfVectorizer
-from transformers import pipeline
+
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s\.\-\+\#\@]')
+
+EXPERIENCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:worked|employed|experience)\s+(?:as|at|with)\s+([^.]+)',
+    r'(?:software engineer|developer|analyst|manager)\s+at\s+([^.]+)',
+    r'(\d+)\s+(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
+))
+
+EDUCATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:bachelor|master|phd|degree)\s+(?:of|in|from)\s+([^.]+)',
+    r'(?:university|college|institute)\s+of\s+([^.]+)',
+    r'(?:b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|ph\.?d\.?)\s+in\s+([^.]+)',
+))
+
+PROJECT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:project|built|developed|created)\s*:?\s*([^.]+)',
+    r'(?:github|portfolio)\s*:?\s*([^.]+)',
+))
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/([a-zA-Z0-9-]+)', re.IGNORECASE)
+
+SUMMARY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r'(?:summary|objective|profile)\s*:?\s*([^.]+(?:\.[^.]+){0,2})',
+    r'^([^.]+(?:\.[^.]+){0,2})',  # First few sentences
+))
+
+PARSE_CACHE_SIZE = 256
+
+@lru_cache(maxsize=1)
+def _ensure_nltk():
+    """Fetch the NLTK data the parser uses, once per process"""
+    import nltk
+    try:
+        nltk.download('punkt', quiet=True)
+        nltk.download('stopwords', quiet=True)
+    except Exception:
+        pass
+
+# Images that bake the data in (scripts/bootstrap_nltk.py) can skip the check entirely
+if os.getenv("AISVC_SKIP_NLTK") != "1":
+    _ensure_nltk()
 
 class ResumeParser:
     def __init__(self):
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
-        
-        # Initialize NLTK
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-        except:
-            pass
-        
         # Skills database
         self.tech_skills = {
             'programming_languages': [
@@ -53,9 +85,64 @@ class ResumeParser:
         self.all_skills = []
         for category in self.tech_skills.values():
             self.all_skills.extend(category)
+        
+        # One alternation scans the text once for every skill, with the same word boundaries
+        # the per-skill searches used
+        self.skill_pattern = re.compile(
+            r'\b(?:' + '|'.join(re.escape(skill.lower()) for skill in self.all_skills) + r')\b'
+        )
+        self.skill_titles = {skill.lower(): skill.title() for skill in self.all_skills}
+        
+        # Required skills per target role, first matching key wins
+        self.role_skill_map = {
+            'software engineer': ['python', 'javascript', 'git', 'sql', 'react', 'nodejs'],
+            'data scientist': ['python', 'r', 'machine learning', 'pandas', 'numpy', 'sql'],
+            'frontend developer': ['javascript', 'react', 'html', 'css', 'typescript', 'webpack'],
+            'backend developer': ['python', 'nodejs', 'sql', 'mongodb', 'express', 'django'],
+            'full stack developer': ['javascript', 'python', 'react', 'nodejs', 'sql', 'git'],
+            'devops engineer': ['docker', 'kubernetes', 'aws', 'jenkins', 'terraform', 'git'],
+            'product manager': ['agile', 'scrum', 'analytics', 'sql', 'project management'],
+        }
+        # Default skills for any tech role
+        self.default_role_skills = ['git', 'sql', 'python', 'javascript', 'agile']
+        
+        # Target roles repeat across requests; cache the substring match per role
+        self._get_role_skills = lru_cache(maxsize=64)(self._get_role_skills)
+        
+        # Parsed results keyed by the SHA-256 digest of the raw text, oldest first
+        self._parse_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+
+    @cached_property
+    def nlp(self):
+        """spaCy model, imported and loaded on first use; parsing itself is regex-based and never needs it"""
+        import spacy
+        try:
+            return spacy.load("en_core_web_sm")
+        except OSError:
+            print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+            return None
 
     def parse(self, text: str) -> Dict:
-        """Parse resume text and extract structured information"""
+        """Parse resume text and extract structured information, reusing the result for repeated text"""
+        key = hashlib.sha256(text.encode('utf-8', 'surrogatepass')).digest()
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                self._parse_cache.move_to_end(key)
+        
+        if cached is None:
+            cached = self._parse(text)
+            with self._parse_cache_lock:
+                self._parse_cache[key] = cached
+                if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
+        
+        # Callers get their own copy, so mutating a result cannot corrupt the cache
+        return copy.deepcopy(cached)
+
+    def _parse(self, text: str) -> Dict:
+        """Uncached body of parse"""
         
         # Clean text
         cleaned_text = self._clean_text(text)
@@ -91,20 +178,22 @@ class ResumeParser:
         }
         
         # Analyze skills by category
-        user_skills = [skill.lower() for skill in parsed_data.get('skills', [])]
+        user_skills = {skill.lower() for skill in parsed_data.get('skills', [])}
+        total_matched = 0
         
         for category, category_skills in self.tech_skills.items():
             matched_skills = [skill for skill in category_skills if skill in user_skills]
+            total_matched += len(matched_skills)
             analysis['skillCategories'][category] = {
                 'matched': matched_skills,
                 'count': len(matched_skills),
                 'percentage': len(matched_skills) / len(category_skills) * 100
             }
         
-        # Calculate overall match score
+        # Calculate overall match score; all_skills is the categories concatenated, so their
+        # matches add up to its match count
         total_skills = len(self.all_skills)
-        matched_skills = len([skill for skill in self.all_skills if skill in user_skills])
-        analysis['matchScore'] = min(100, (matched_skills / total_skills) * 100 * 2)  # Boost score
+        analysis['matchScore'] = min(100, (total_matched / total_skills) * 100 * 2)  # Boost score
         
         # Generate strengths
         if analysis['skillCategories']['programming_languages']['count'] > 2:
@@ -124,117 +213,80 @@ class ResumeParser:
         
         # Missing skills for target role
         if target_role:
-            role_skills = self._get_role_skills(target_role)
+            role_skills = self._get_role_skills(target_role.lower())
             analysis['missingSkills'] = [skill for skill in role_skills if skill not in user_skills]
         
         return analysis
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove extra whitespace; str.split uses the same whitespace set as \s
+        text = ' '.join(text.split())
         # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\.\-\+\#\@]', ' ', text)
+        text = SPECIAL_CHAR_PATTERN.sub(' ', text)
         return text.strip()
 
     def _extract_skills(self, text: str) -> List[str]:
         """Extract technical skills from text"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in self.all_skills:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill.title())
-        
-        # Remove duplicates and return
-        return list(set(found_skills))
+        # Distinct skills in the order they first appear
+        matches = self.skill_pattern.findall(text.lower())
+        return list(dict.fromkeys(self.skill_titles[match] for match in matches))
 
     def _extract_experience(self, text: str) -> List[str]:
         """Extract work experience information"""
-        experience = []
-        
-        # Look for experience patterns
-        experience_patterns = [
-            r'(?:worked|employed|experience)\s+(?:as|at|with)\s+([^.]+)',
-            r'(?:software engineer|developer|analyst|manager)\s+at\s+([^.]+)',
-            r'(\d+)\s+(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
-        ]
-        
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            experience.extend(matches)
-        
-        # Clean and limit results
-        experience = [exp.strip()[:100] for exp in experience if len(exp.strip()) > 5]
-        return experience[:5]  # Limit to 5 entries
+        # Look for experience patterns; limit to 5 entries
+        return self._collect_matches(EXPERIENCE_PATTERNS, text, 5, 100, 5)
 
     def _extract_education(self, text: str) -> List[str]:
         """Extract education information"""
-        education = []
-        
-        education_patterns = [
-            r'(?:bachelor|master|phd|degree)\s+(?:of|in|from)\s+([^.]+)',
-            r'(?:university|college|institute)\s+of\s+([^.]+)',
-            r'(?:b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|ph\.?d\.?)\s+in\s+([^.]+)',
-        ]
-        
-        for pattern in education_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            education.extend(matches)
-        
-        return [edu.strip()[:100] for edu in education if len(edu.strip()) > 3][:3]
+        return self._collect_matches(EDUCATION_PATTERNS, text, 3, 100, 3)
 
     def _extract_projects(self, text: str) -> List[str]:
         """Extract project information"""
-        projects = []
-        
-        project_patterns = [
-            r'(?:project|built|developed|created)\s*:?\s*([^.]+)',
-            r'(?:github|portfolio)\s*:?\s*([^.]+)',
-        ]
-        
-        for pattern in project_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            projects.extend(matches)
-        
-        return [proj.strip()[:150] for proj in projects if len(proj.strip()) > 10][:5]
+        return self._collect_matches(PROJECT_PATTERNS, text, 10, 150, 5)
+
+    def _collect_matches(self, patterns, text: str, min_length: int, max_length: int, limit: int) -> List[str]:
+        """First limit captures longer than min_length, pattern by pattern, each trimmed to max_length"""
+        results = []
+        
+        for pattern in patterns:
+            for match in pattern.finditer(text):
+                value = match.group(1).strip()
+                if len(value) > min_length:
+                    results.append(value[:max_length])
+                    # Stop scanning once enough entries are found
+                    if len(results) == limit:
+                        return results
+        
+        return results
 
     def _extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information"""
         contact = {}
         
+        # Only the first match of each is used, so search stops at it instead of scanning on
         # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            contact['email'] = emails[0]
+        email = EMAIL_PATTERN.search(text)
+        if email:
+            contact['email'] = email.group()
         
         # Phone pattern
-        phone_pattern = r'(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-        phones = re.findall(phone_pattern, text)
-        if phones:
-            contact['phone'] = f"({phones[0][0]}) {phones[0][1]}-{phones[0][2]}"
+        phone = PHONE_PATTERN.search(text)
+        if phone:
+            contact['phone'] = f"({phone.group(1)}) {phone.group(2)}-{phone.group(3)}"
         
         # LinkedIn pattern
-        linkedin_pattern = r'linkedin\.com/in/([a-zA-Z0-9-]+)'
-        linkedin = re.findall(linkedin_pattern, text, re.IGNORECASE)
+        linkedin = LINKEDIN_PATTERN.search(text)
         if linkedin:
-            contact['linkedin'] = f"linkedin.com/in/{linkedin[0]}"
+            contact['linkedin'] = f"linkedin.com/in/{linkedin.group(1)}"
         
         return contact
 
     def _extract_summary(self, text: str) -> str:
         """Extract or generate a summary"""
         # Look for summary/objective sections
-        summary_patterns = [
-            r'(?:summary|objective|profile)\s*:?\s*([^.]+(?:\.[^.]+){0,2})',
-            r'^([^.]+(?:\.[^.]+){0,2})',  # First few sentences
-        ]
-        
-        for pattern in summary_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in SUMMARY_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
                 summary = matches[0].strip()
                 if len(summary) > 50:
@@ -243,23 +295,10 @@ class ResumeParser:
         # Fallback: use first 200 characters
         return text[:200] + '...' if len(text) > 200 else text
 
-    def _get_role_skills(self, role: str) -> List[str]:
-        """Get required skills for a specific role"""
-        role_lower = role.lower()
-        
-        role_skill_map = {
-            'software engineer': ['python', 'javascript', 'git', 'sql', 'react', 'nodejs'],
-            'data scientist': ['python', 'r', 'machine learning', 'pandas', 'numpy', 'sql'],
-            'frontend developer': ['javascript', 'react', 'html', 'css', 'typescript', 'webpack'],
-            'backend developer': ['python', 'nodejs', 'sql', 'mongodb', 'express', 'django'],
-            'full stack developer': ['javascript', 'python', 'react', 'nodejs', 'sql', 'git'],
-            'devops engineer': ['docker', 'kubernetes', 'aws', 'jenkins', 'terraform', 'git'],
-            'product manager': ['agile', 'scrum', 'analytics', 'sql', 'project management'],
-        }
-        
-        for role_key, skills in role_skill_map.items():
+    def _get_role_skills(self, role_lower: str) -> List[str]:
+        """Get required skills for a specific lower-cased role"""
+        for role_key, skills in self.role_skill_map.items():
             if role_key in role_lower:
                 return skills
         
-        # Default skills for any tech role
-        return ['git', 'sql', 'python', 'javascript', 'agile']
+        return self.default_role_skills